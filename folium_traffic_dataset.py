@@ -0,0 +1,223 @@
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import folium
+import geopandas as gpd
+import numpy as np
+import orjson
+import pandas as pd
+import plotly.express as px
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_URL = "https://data.cityofchicago.org/resource/sxs8-h27x.json"
+PAGE_SIZE = 1000
+MAX_WORKERS = 8
+
+SCHEMA = {
+    "start_latitude": "float32",
+    "start_longitude": "float32",
+    "end_latitude": "float32",
+    "end_longitude": "float32",
+    "speed": "float32",
+    "length": "float32",
+    "bus_count": "float32",
+    "message_count": "float32",
+}
+
+CHICAGO_CENTER = [41.8781, -87.6298]
+ADJACENCY_RADIUS_M = 100.0
+
+CACHE_PATH = "traffic_cache.parquet"
+CACHE_MAX_AGE_S = 3600
+
+
+def _make_session():
+    """Build a pooled session that retries on rate limits and server errors."""
+    session = requests.Session()
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503])
+    adapter = HTTPAdapter(
+        pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_data():
+    """Download the full traffic dataset from the Chicago data portal.
+
+    Pages are independent, so they are fetched concurrently over a pooled
+    keep-alive session instead of one sequential GET per offset.
+    """
+    session = _make_session()
+    count_response = session.get(API_URL, params={"$select": "count(*) as count"})
+    count_response.raise_for_status()
+    total = int(count_response.json()[0]["count"])
+
+    def fetch_page(offset):
+        response = session.get(API_URL, params={"$limit": PAGE_SIZE, "$offset": offset})
+        response.raise_for_status()
+        return pd.DataFrame(orjson.loads(response.content))
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        frames = list(executor.map(fetch_page, range(0, total, PAGE_SIZE)))
+    df = pd.concat(frames, ignore_index=True)
+    return df.astype({col: dtype for col, dtype in SCHEMA.items() if col in df.columns})
+
+
+def clean_data(df):
+    """Flatten dict-valued columns to strings and fill gaps."""
+    dict_cols = [
+        col for col in df.columns if len(df) and isinstance(df[col].iloc[0], dict)
+    ]
+    if dict_cols:
+        df[dict_cols] = df[dict_cols].astype(str)
+    df.ffill(inplace=True)
+    return df
+
+
+def filter_negative_values(df):
+    """Drop rows with a negative reading in any numeric column."""
+    numeric = df.select_dtypes(include="number")
+    mask = np.all(numeric.to_numpy() >= 0, axis=1)
+    return df.loc[mask]
+
+
+def store_to_sqlite(df, db_name="traffic_data.db", table_name="traffic"):
+    """Persist the cleaned dataset to a local SQLite database."""
+    conn = sqlite3.connect(db_name)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    with conn:
+        df.to_sql(
+            table_name,
+            conn,
+            if_exists="replace",
+            index=False,
+            method="multi",
+            chunksize=1000,
+        )
+    conn.close()
+
+
+def find_adjacent_intersections(gdf):
+    """Return adjacency as a pair of row-index arrays (source, target).
+
+    Runs a single bulk dwithin query against the frame's cached spatial
+    index instead of scanning the whole frame per row. Querying in a
+    metric CRS keeps the radius a real distance, and the distance
+    predicate needs no buffer polygons at all.
+    """
+    gdf_m = gdf.to_crs(epsg=3857)
+    left, right = gdf_m.sindex.query(
+        gdf_m.geometry, predicate="dwithin", distance=ADJACENCY_RADIUS_M
+    )
+    keep = left != right
+    return left[keep], right[keep]
+
+
+def build_map(gdf, adjacency):
+    """Render the intersections and their adjacencies on a Folium map."""
+    chicago_map = folium.Map(location=CHICAGO_CENTER, zoom_start=11)
+
+    streets = gdf["street"].to_numpy()
+    start_lats = gdf["start_latitude"].to_numpy()
+    start_lons = gdf["start_longitude"].to_numpy()
+    end_lats = gdf["end_latitude"].to_numpy()
+    end_lons = gdf["end_longitude"].to_numpy()
+
+    intersections = folium.FeatureGroup(name="intersections")
+    for lat, lon, street in zip(start_lats, start_lons, streets):
+        intersections.add_child(
+            folium.CircleMarker(
+                location=[lat, lon],
+                radius=3,
+                color="blue",
+                fill=True,
+                popup=street,
+            )
+        )
+    chicago_map.add_child(intersections)
+
+    adjacent = folium.FeatureGroup(name="adjacent")
+    src_idx, tgt_idx = adjacency
+    for src, tgt in zip(src_idx, tgt_idx):
+        popup = f"{streets[src]} -> {streets[tgt]}"
+        adjacent.add_child(
+            folium.Marker(
+                location=[start_lats[tgt], start_lons[tgt]],
+                popup=popup,
+                icon=folium.Icon(color="green", icon="flag"),
+            )
+        )
+        adjacent.add_child(
+            folium.Marker(
+                location=[end_lats[tgt], end_lons[tgt]],
+                popup=popup,
+                icon=folium.Icon(color="red", icon="flag"),
+            )
+        )
+    chicago_map.add_child(adjacent)
+
+    chicago_map.save("chicago_traffic_map.html")
+
+
+def _render_hour(task):
+    """Build and write one hourly heatmap; runs in a worker process."""
+    index, records = task
+    each_hour = pd.DataFrame(records)
+    fig = px.density_mapbox(
+        each_hour,
+        lat="start_latitude",
+        lon="start_longitude",
+        z="speed",
+        radius=10,
+        center={"lat": CHICAGO_CENTER[0], "lon": CHICAGO_CENTER[1]},
+        zoom=9,
+        mapbox_style="open-street-map",
+    )
+    fig.write_html(f"traffic_heatmap_hour_{index}.html")
+
+
+def generate_hourly_heatmaps(df):
+    """Write one speed heatmap per hour of the day."""
+    df["hour"] = pd.to_datetime(df["time"], format="ISO8601", cache=True).dt.hour
+    plot_cols = ["start_latitude", "start_longitude", "speed"]
+    tasks = [
+        (index, each_hour[plot_cols].to_dict("records"))
+        for index, (hour, each_hour) in enumerate(df.groupby("hour", sort=False), 1)
+    ]
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_render_hour, tasks))
+
+
+def load_data():
+    """Return the cleaned dataset, reusing a recent on-disk parquet cache."""
+    if (
+        os.path.exists(CACHE_PATH)
+        and time.time() - os.path.getmtime(CACHE_PATH) < CACHE_MAX_AGE_S
+    ):
+        return pd.read_parquet(CACHE_PATH)
+    df = fetch_data()
+    df = clean_data(df)
+    df = filter_negative_values(df)
+    df.to_parquet(CACHE_PATH, compression="zstd")
+    return df
+
+
+if __name__ == "__main__":
+    df = load_data()
+    store_to_sqlite(df)
+
+    gdf = gpd.GeoDataFrame(
+        df, geometry=gpd.points_from_xy(df["start_longitude"], df["start_latitude"])
+    )
+    gdf = gdf.set_crs(epsg=4326)
+
+    adjacency = find_adjacent_intersections(gdf)
+    build_map(gdf, adjacency)
+    generate_hourly_heatmaps(df)